@@ -1,7 +1,7 @@
 import asyncio
 from floggit import flog
 import dotenv
-import json
+import orjson
 import os
 import requests
 from typing import Any, Optional, Dict
@@ -62,7 +62,7 @@ def modify_final_response(callback_context: CallbackContext) -> Optional[types.C
 
     if scout_report := callback_context.state.get('scout_report'):
         return types.Content(
-            parts=[types.Part(text=json.dumps(scout_report,indent=1))],
+            parts=[types.Part(text=orjson.dumps(scout_report, option=orjson.OPT_INDENT_2).decode())],
             role='model'
         )
 
@@ -15,6 +15,8 @@ from google.genai import types
 from google.adk.tools import google_search
 from google.adk.tools.agent_tool import AgentTool
 
+from utils.logger import logger
+
 dotenv.load_dotenv()
 session_service = InMemorySessionService()
 APP_NAME = 'kaybee_agent'
@@ -64,23 +66,25 @@ agent = Agent(
     ],
 )
 
+# NOTE: built once and reused by every curation run, only the session is per-run
+runner = Runner(
+    agent=agent,
+    app_name=APP_NAME,
+    session_service=session_service
+)
+
 async def call_agent():
     session = await session_service.create_session(
             app_name=APP_NAME, user_id=USER_ID)
 
-    runner = Runner(
-        agent=agent,
-        app_name=APP_NAME,
-        session_service=session_service
-    )
-
     user_content = types.Content(role='user', parts=[types.Part(text=f'Expand the knowledge graph.')])
     result = runner.run_async(
             user_id=USER_ID, session_id=session.id, new_message=user_content)
 
     # Need this line.... Is there a good replacement?
     async for event in result:
-        print(event)
+        # NOTE: events can be large, only render them when debug logging is enabled
+        logger.opt(lazy=True).debug('curation agent event: {}', lambda: event)
         #pass
 
 
@@ -15,14 +15,14 @@ async def generate_scout_report(query: str, athlete_name: str) -> dict:
     - Scout report dict with 'player' key (success) - save to GCS
     - {"text": str} - Needs clarification, return to root agent
     """
-    research_result = research_player(query, athlete_name)
+    research_result = await research_player(query, athlete_name)
 
     if research_result["status"] != "success":
         return {
             "text": research_result.get("message", "Unable to complete research")
         }
 
-    scout_report = format_to_schema(
+    scout_report = await format_to_schema(
         research_notes=research_result["notes"],
         sources=research_result["sources"]
     )
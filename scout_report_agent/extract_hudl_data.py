@@ -3,11 +3,13 @@ from utils.logger import logger, _log_fields
 from sources.hudl.scrape_hudl_profile_data import scrape_hudl_profile_data
 from sources.hudl.hudl_types import HudlPlayerData
 
+_HUDL_PROFILE_URL_RE = re.compile(r'https://www\.hudl\.com/profile/\d+(?:/[\w-]+)?$')
+
 async def extract_hudl_profile_data(profile_url: str) -> HudlPlayerData | None:
   try:
     logger.info('received request to scrape hudl profile', **_log_fields(url=profile_url))
     
-    if not re.match(r'https://www\.hudl\.com/profile/\d+(?:/[\w-]+)?$', profile_url):
+    if not _HUDL_PROFILE_URL_RE.match(profile_url):
       logger.error('invalid hudl profile URL format', **_log_fields(profile_url=profile_url))
       return None
 
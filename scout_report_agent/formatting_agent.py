@@ -2,10 +2,12 @@
 Formatting Agent - Converts research notes to structured ScoutReport with inline citations
 """
 
-import os
-from google import genai
+import copy
+import functools
+import json
 from google.genai import types
-from .scout_report_schema import ScoutReport
+from .genai_client import get_genai_client
+from .scout_report_schema import ScoutReport, SCOUT_REPORT_ADAPTER, get_scout_report_json_schema
 from utils.logger import logger
 
 FORMATTING_PROMPT = '''
@@ -46,8 +48,34 @@ Convert the research notes below into a structured scout report.
 '''
 
 
+@functools.cache
+def _generation_config(temperature: float) -> types.GenerateContentConfig:
+    """Structured-output config, built once per temperature and shared across calls."""
+    return types.GenerateContentConfig(
+        temperature=temperature,
+        response_mime_type='application/json',
+        # NOTE: the SDK regenerates the JSON schema per request when handed the model class,
+        # pass the cached schema instead (copied, since the SDK rewrites it in place)
+        response_schema=copy.deepcopy(get_scout_report_json_schema()),
+        # NOTE: this step only re-formats the research notes, so skip the thinking decode
+        thinking_config=types.ThinkingConfig(thinking_budget=0)
+    )
+
+
+def stringify_all(obj):
+    """Recursively convert all values to strings, except None"""
+    if obj is None:
+        return None
+    elif isinstance(obj, dict):
+        return {k: stringify_all(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [stringify_all(item) for item in obj]
+    else:
+        return str(obj)
+
+
 @logger.catch(reraise=True)
-def format_to_schema(research_notes: str, sources: list[str]) -> ScoutReport:
+async def format_to_schema(research_notes: str, sources: list[str]) -> ScoutReport:
     """
     Convert research notes to structured ScoutReport using Gemini.
 
@@ -58,11 +86,7 @@ def format_to_schema(research_notes: str, sources: list[str]) -> ScoutReport:
     Returns:
         ScoutReport pydantic model
     """
-    client = genai.Client(
-        vertexai=True,
-        project=os.environ.get('GOOGLE_CLOUD_PROJECT'),
-        location=os.environ.get('GOOGLE_CLOUD_LOCATION')
-    )
+    client = await get_genai_client()
 
     # Create sources reference for the prompt
     sources_text = "\n".join([f"[{i+1}] {url}" for i, url in enumerate(sources)])
@@ -79,34 +103,17 @@ def format_to_schema(research_notes: str, sources: list[str]) -> ScoutReport:
     max_retries = 3
     for attempt in range(max_retries):
         try:
-            response = client.models.generate_content(
+            response = await client.aio.models.generate_content(
                 model='gemini-2.5-flash',
                 contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.1 if attempt == 0 else 0.0,  # Lower temp on retries
-                    response_mime_type='application/json',
-                    response_schema=ScoutReport
-                )
+                config=_generation_config(0.1 if attempt == 0 else 0.0)  # Lower temp on retries
             )
             
             # Parse the JSON response into ScoutReport
-            import json
-
-            def stringify_all(obj):
-                """Recursively convert all values to strings, except None"""
-                if obj is None:
-                    return None
-                elif isinstance(obj, dict):
-                    return {k: stringify_all(v) for k, v in obj.items()}
-                elif isinstance(obj, list):
-                    return [stringify_all(item) for item in obj]
-                else:
-                    return str(obj)
-
             data = json.loads(response.text)
             data = stringify_all(data)
 
-            return ScoutReport.model_validate(data)
+            return SCOUT_REPORT_ADAPTER.validate_python(data)
             
         except json.JSONDecodeError as e:
             logger.error(
@@ -123,7 +130,9 @@ def format_to_schema(research_notes: str, sources: list[str]) -> ScoutReport:
             # Continue to next retry
             
         except Exception as e:
-            logger.exception(f"formatting agent raised an exception on attempt {attempt + 1}")
+            # NOTE: formatting the full traceback is costly, only do it once retries are exhausted
             if attempt == max_retries - 1:
+                logger.exception(f"formatting agent raised an exception on attempt {attempt + 1}")
                 raise
+            logger.warning(f"formatting agent raised an exception on attempt {attempt + 1}: {e}")
             # Continue to next retry
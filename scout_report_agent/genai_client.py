@@ -0,0 +1,36 @@
+import asyncio
+import os
+from google import genai
+from utils.logger import logger
+
+# NOTE: client.aio keeps one aiohttp session bound to the event loop that first used it, so keep one client per loop
+_client: genai.Client | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def get_genai_client() -> genai.Client:
+    """
+    Vertex AI client shared by the scout report agents.
+
+    Built on first use and reused so the HTTP connection pool and auth credentials
+    are not re-created on every research/formatting call.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        stale_client = _client
+        _client = genai.Client(
+            vertexai=True,
+            project=os.environ.get('GOOGLE_CLOUD_PROJECT'),
+            location=os.environ.get('GOOGLE_CLOUD_LOCATION')
+        )
+        _client_loop = loop
+
+        # NOTE: the SDK has no public close, so close the aiohttp session the previous loop's client left behind
+        stale_session = getattr(getattr(stale_client, '_api_client', None), '_aiohttp_session', None)
+        if stale_session is not None and not stale_session.closed:
+            try:
+                await stale_session.close()
+            except Exception:
+                logger.warning('failed to close the genai session of a previous event loop')
+    return _client
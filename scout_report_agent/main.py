@@ -1,11 +1,7 @@
 import datetime as dt
 from utils.logger import logger
-from dotenv import load_dotenv
 from .agent import generate_scout_report
-from .scout_report_service import store_scout_report
-
-# Load environment variables from .env file in root directory
-load_dotenv()
+from .scout_report_service import store_scout_report_async
 
 @logger.catch(reraise=True)
 async def main(graph_id: str, user_id: str, query: str, athlete_name: str):
@@ -27,7 +23,7 @@ async def main(graph_id: str, user_id: str, query: str, athlete_name: str):
     if 'player' in scout_report:
         utc_now = dt.datetime.now(dt.UTC).isoformat(timespec='seconds')
         scout_report.update({'report_at': utc_now})
-        scout_report_id = store_scout_report(scout_report)
+        scout_report_id = await store_scout_report_async(scout_report)
         scout_report.update({'id': scout_report_id})
         return scout_report
 
@@ -1,15 +1,43 @@
-import os
-import requests
-import json
+import aiohttp
+import orjson
+import asyncio
 import re
-from google import genai
 from google.genai import types
+from .genai_client import get_genai_client
+from utils.http_session import get_session
 from utils.logger import logger, _log_fields
 from .prompts.research_prompt import RESEARCH_PROMPT
 from .tools.search_hudl_player import search_hudl_player as search_hudl_player_impl
 
+# NOTE: built once at import so the tool protos and config are not re-created on every research call
+_TOOLS = [
+    types.Tool(google_search=types.GoogleSearch()),
+    types.Tool(url_context=types.UrlContext())
+]
+_GENERATION_CONFIG = types.GenerateContentConfig(
+    temperature=0.1,
+    tools=_TOOLS
+)
+
+_PROFILE_ID_RE = re.compile(r'/profile/(\d+)')
+_GROUNDING_REDIRECT = 'vertexaisearch.cloud.google.com/grounding-api-redirect'
+_REDIRECT_TIMEOUT = aiohttp.ClientTimeout(total=3)
+# NOTE: caps the redirect lookups in flight for one research call
+_MAX_CONCURRENT_REDIRECTS = 8
+
+
+async def _resolve_redirect(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, uri: str) -> str:
+    """Resolve a grounding API redirect URL to the actual URL, keeping the original if that fails."""
+    try:
+        async with semaphore:
+            async with session.head(uri, allow_redirects=True, timeout=_REDIRECT_TIMEOUT) as response:
+                return str(response.url)
+    except Exception:
+        return uri
+
+
 @logger.catch(reraise=True)
-def research_player(query: str, athlete_name: str) -> dict:
+async def research_player(query: str, athlete_name: str) -> dict:
     """
     Research a player using Gemini with grounded search.
 
@@ -18,47 +46,39 @@ def research_player(query: str, athlete_name: str) -> dict:
         - {"status": "success", "notes": str, "sources": [str]} - Research complete, ready to format
         - {"status": "feedback", "message": str} - Needs clarification (AMBIGUOUS, NOT FOUND, etc.)
     """
-    client = genai.Client(
-        vertexai=True,
-        project=os.environ.get('GOOGLE_CLOUD_PROJECT'),
-        location=os.environ.get('GOOGLE_CLOUD_LOCATION')
-    )
+    client = await get_genai_client()
 
     hudl_search_result = None
     try:
-        hudl_result_json = search_hudl_player_impl(athlete_name)
-        hudl_search_result = json.loads(hudl_result_json)
+        hudl_result_json = await search_hudl_player_impl(athlete_name)
+        hudl_search_result = orjson.loads(hudl_result_json)
         logger.info("hudl pre-search completed", *_log_fields(query=query, result=hudl_search_result))
     except Exception as e:
         logger.warning(f"hudl pre-search failed for '{query}': {e}")
 
-    prompt_with_context = f"{RESEARCH_PROMPT}\n\n**PLAYER TO RESEARCH:** {query}"
+    prompt_parts = [f"{RESEARCH_PROMPT}\n\n**PLAYER TO RESEARCH:** {query}"]
     
     if hudl_search_result and hudl_search_result.get('status') == 'success':
         urls = hudl_search_result.get('urls', [])
         if urls:
-            prompt_with_context += f"\n\n**HUDL SEARCH RESULTS:**\nFound {len(urls)} Hudl profile(s). Candidate URLs:\n"
+            prompt_parts.append(f"\n\n**HUDL SEARCH RESULTS:**\nFound {len(urls)} Hudl profile(s). Candidate URLs:\n")
             seen_ids = set()
             for url in urls:
-                profile_match = re.search(r'/profile/(\d+)', url)
+                profile_match = _PROFILE_ID_RE.search(url)
                 if profile_match:
                     profile_id = profile_match.group(1)
                     if profile_id not in seen_ids:
                         seen_ids.add(profile_id)
-                        prompt_with_context += f"- {url}\n"
-            prompt_with_context += "\nVerify which profile matches the player by checking the profile content (name, school, position, graduation year)."
+                        prompt_parts.append(f"- {url}\n")
+            prompt_parts.append("\nVerify which profile matches the player by checking the profile content (name, school, position, graduation year).")
+
+    prompt_with_context = "".join(prompt_parts)
 
     try:
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model='gemini-2.5-flash',
             contents=prompt_with_context,
-            config=types.GenerateContentConfig(
-                temperature=0.1,
-                tools=[
-                    types.Tool(google_search=types.GoogleSearch()),
-                    types.Tool(url_context=types.UrlContext())
-                ]
-            )
+            config=_GENERATION_CONFIG
         )
     except Exception as e:
         logger.exception("research agent raised an exception")
@@ -75,26 +95,22 @@ def research_player(query: str, athlete_name: str) -> dict:
             "message": response_text
         }
 
-    sources = []
-
-    if hasattr(response, 'candidates') and response.candidates:
-            candidate = response.candidates[0]
-            if hasattr(candidate, 'grounding_metadata') and candidate.grounding_metadata:
-                grounding_chunks = getattr(candidate.grounding_metadata, 'grounding_chunks', None)
-                if grounding_chunks and hasattr(grounding_chunks, '__iter__'):
-                    for chunk in grounding_chunks:
-                        if hasattr(chunk, 'web') and chunk.web:
-                            uri = chunk.web.uri
-                            # Resolve grounding API redirect URLs to actual URLs
-                            if uri and 'vertexaisearch.cloud.google.com/grounding-api-redirect' in uri:
-                                try:
-                                    resp = requests.head(uri, allow_redirects=True, timeout=3)
-                                    actual_url = resp.url
-                                    if actual_url != uri:
-                                        uri = actual_url
-                                except Exception:
-                                    pass  # Keep the original URI if redirect fails
-                            sources.append(uri)
+    candidates = getattr(response, 'candidates', None) or ()
+    grounding_metadata = getattr(candidates[0], 'grounding_metadata', None) if candidates else None
+    grounding_chunks = getattr(grounding_metadata, 'grounding_chunks', None) or ()
+
+    uris = [web.uri for chunk in grounding_chunks if (web := getattr(chunk, 'web', None))]
+
+    # NOTE: grounding chunks often repeat the same redirect, resolve each unique one once and in parallel
+    redirect_uris = list(dict.fromkeys(uri for uri in uris if uri and _GROUNDING_REDIRECT in uri))
+    resolved_uris = {}
+    if redirect_uris:
+        session = await get_session()
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REDIRECTS)
+        resolved = await asyncio.gather(*(_resolve_redirect(session, semaphore, uri) for uri in redirect_uris))
+        resolved_uris = dict(zip(redirect_uris, resolved))
+
+    sources = [resolved_uris.get(uri, uri) for uri in uris]
 
     return {
         "status": "success",
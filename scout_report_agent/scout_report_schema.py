@@ -1,11 +1,15 @@
-from pydantic import BaseModel, Field
-from typing import Dict, List, Any, Optional
+import functools
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.json_schema import SkipJsonSchema
+from typing import Dict, Final, List, Any, Optional, Tuple
 
 
 class AnalysisItem(BaseModel):
     """
     Represents a single item of analysis (award, strength, weakness, quote).
     """
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(
         ...,
         description="The category or title of the analysis item (e.g., 'Awards', 'Strengths', 'Weaknesses', 'Coach Quotes')."
@@ -36,9 +40,10 @@ class Player(BaseModel):
         None,
         description="The player hudl.com profile url, e.g., https://www.hudl.com/profile/..."
     )
-    highlighted_reel: Optional[str] = Field(
+    # NOTE: filled in from the scraped hudl profile, kept out of the LLM response schema
+    highlighted_reel: SkipJsonSchema[Optional[str]] = Field(
         None,
-        description="The latest player highlight reel, IMPORTANT: ignore this field"
+        description="The latest player highlight reel"
     )
     avatar_url: Optional[str] = Field(
         None,
@@ -54,19 +59,32 @@ class ScoutReport(BaseModel):
         ...,
         description="The profile object containing the player's name and identifying details."
     )
-    tags: List[str] = Field(
-        default_factory=list,
+    tags: Tuple[str, ...] = Field(
+        (),
         description="Smart, searchable tags that make sense for this player. Include what's relevant and important for filtering/searching. Examples of useful tags: sport, position, high school (with 'High School:' prefix), location (City, ST or City, Country), grad year, college status (with 'College:' prefix, add '(committed)' if not enrolled), star rating with source in parentheses, additional sports. Be smart and flexible."
     )
     analysis: List[AnalysisItem] = Field(
         default_factory=list,
         description="A list of analyses or opinions such as awards, rankings, strengths, and weaknesses."
     )
-    stats: List[str] = Field(
-        default_factory=list,
+    stats: Tuple[str, ...] = Field(
+        (),
         description="A list of 3-6 key statistics - prioritize latest performance stats. Each stat should be a complete, self-explanatory statement with season/year. Format examples: '3,245 Passing Yards (2024/25)', '42 TD, 4 INT (2024/25)', '68.2% Completion (2024/25)'."
     )
-    citations: List[str] = Field(
-        default_factory=list,
+    citations: Tuple[str, ...] = Field(
+        (),
         description="A list of urls from which this information was obtained."
     )
+
+
+SCOUT_REPORT_ADAPTER: Final = TypeAdapter(ScoutReport)
+
+
+@functools.cache
+def get_scout_report_json_schema() -> dict:
+    """
+    JSON schema for ScoutReport, generated once per process.
+
+    Callers must not mutate the returned dict; copy it first if needed.
+    """
+    return ScoutReport.model_json_schema()
@@ -1,16 +1,94 @@
-import json
+import asyncio
+import atexit
+import copy
+import functools
 import os
+import threading
+from cachetools import TTLCache
 from floggit import flog
-from dotenv import load_dotenv
 from .utils import generate_random_string
-from utils.logger import logger
+from utils.logger import logger, _log_fields
 
-load_dotenv()
+import bson
+from pymongo import AsyncMongoClient, InsertOne, MongoClient
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.collection import Collection
+
+_CLIENT_OPTIONS = dict(
+    # NOTE: keep a few warm connections around so concurrent reports skip the TLS/auth handshake
+    maxPoolSize=50,
+    minPoolSize=5,
+    maxIdleTimeMS=60_000,
+    retryWrites=True,
+    # NOTE: reports are mostly prose, compress them on the wire (zstd first, fast zlib as a fallback)
+    compressors='zstd,zlib',
+    zlibCompressionLevel=1,
+)
+
+
+@functools.cache
+def _reports_collection() -> Collection:
+    """The reports collection for sync callers, sharing the pool settings of the async one."""
+    mongo_client = MongoClient(os.environ['MONGO_URI'], **_CLIENT_OPTIONS)
+    atexit.register(mongo_client.close)
+
+    return mongo_client.get_database('snappstats').get_collection('reports')
+
+
+# NOTE: the async client is bound to the event loop it was first used on, so keep one per loop
+_mongo_client: AsyncMongoClient | None = None
+_mongo_client_loop: asyncio.AbstractEventLoop | None = None
+_async_reports: AsyncCollection | None = None
+_indexes_ensured = False
+
+
+async def _async_reports_collection() -> AsyncCollection:
+    """The reports collection, connecting on first use rather than at import."""
+    global _mongo_client, _mongo_client_loop, _async_reports, _indexes_ensured
+    loop = asyncio.get_running_loop()
+    if _mongo_client is None or _mongo_client_loop is not loop:
+        stale_client = _mongo_client
+        _mongo_client = AsyncMongoClient(os.environ['MONGO_URI'], **_CLIENT_OPTIONS)
+        _mongo_client_loop = loop
+        _async_reports = _mongo_client.get_database('snappstats').get_collection('reports')
+
+        # NOTE: close the client left on the previous loop, or its pool and monitor tasks leak
+        if stale_client is not None:
+            try:
+                await stale_client.close()
+            except Exception:
+                logger.warning('failed to close the mongo client of a previous event loop')
+
+        # NOTE: reports are looked up by id, make sure that is an index hit (once per process, no-op if it exists)
+        if not _indexes_ensured:
+            _indexes_ensured = True
+            try:
+                await _async_reports.create_index('id', unique=True)
+            except Exception:
+                logger.warning('failed to ensure the index on reports.id')
+    return _async_reports
+
+
+# NOTE: this repo never modifies a stored report (every store gets a new id), so hot reports are served from
+# memory; anything else writing to the shared snappstats.reports collection may be stale here for up to the TTL
+_report_cache: TTLCache = TTLCache(
+        maxsize=1024, ttl=float(os.environ.get('SCOUT_REPORT_CACHE_TTL_SECONDS', 300)))
+_report_cache_lock = threading.Lock()
+
+
+def _get_cached_report(scout_report_id: str) -> dict | None:
+    """Returns a copy of the cached report, so callers cannot mutate what later requests see."""
+    with _report_cache_lock:
+        report = _report_cache.get(scout_report_id)
+    return copy.deepcopy(report) if report is not None else None
+
+
+def _cache_reports(reports: dict[str, dict]):
+    """Caches copies of the reports, keyed by ID, so later changes by the caller do not leak into the cache."""
+    reports = copy.deepcopy(reports)
+    with _report_cache_lock:
+        _report_cache.update(reports)
 
-from pymongo import MongoClient
-mongo_client = MongoClient(os.environ['MONGO_URI'])
-database = mongo_client.get_database('snappstats')
-reports_collection = database.get_collection('reports')
 
 @flog
 @logger.catch(reraise=True)
@@ -21,21 +99,132 @@ def fetch_scout_report(scout_report_id: str) -> dict:
     Returns:
         dict: A Scout Report
     '''
-    report = reports_collection.find_one({'id': scout_report_id})
+    report = _get_cached_report(scout_report_id)
+    if report is not None:
+        return report
+
+    report = _reports_collection().find_one(
+            {'id': scout_report_id}, projection={'_id': 0})
 
-    if report:
-        del report['_id']
+    # NOTE: misses are not cached, the report may simply not be stored yet
+    if report is not None:
+        _cache_reports({scout_report_id: report})
 
     return report
 
+
+@logger.catch(reraise=True)
+async def fetch_scout_report_async(scout_report_id: str) -> dict:
+    '''
+    Async variant of fetch_scout_report, for callers running on the event loop.
+
+    Args:
+        scout_report_id (str): The ID of a Scout Report.
+    Returns:
+        dict: A Scout Report
+    '''
+    report = _get_cached_report(scout_report_id)
+    if report is not None:
+        return report
+
+    reports_collection = await _async_reports_collection()
+    report = await reports_collection.find_one(
+            {'id': scout_report_id}, projection={'_id': 0})
+
+    # NOTE: misses are not cached, the report may simply not be stored yet
+    if report is not None:
+        _cache_reports({scout_report_id: report})
+
+    return report
+
+_FETCH_BATCH_SIZE = 1000
+# NOTE: mongo rejects documents over 16MB, warn well before a report gets there
+_LARGE_REPORT_BYTES = 4 * 1024 * 1024
+
+
+@logger.catch(reraise=True)
+async def fetch_scout_reports_async(scout_report_ids: list[str]) -> dict[str, dict]:
+    '''
+    Args:
+        scout_report_ids (list[str]): The IDs of the Scout Reports.
+    Returns:
+        dict[str, dict]: The Scout Reports found, keyed by ID in the order requested
+    '''
+    reports = {
+        scout_report_id: report
+        for scout_report_id in dict.fromkeys(scout_report_ids)
+        if (report := _get_cached_report(scout_report_id)) is not None
+    }
+
+    missing_ids = list(dict.fromkeys(i for i in scout_report_ids if i not in reports))
+    reports_collection = await _async_reports_collection() if missing_ids else None
+    # NOTE: one $in query per batch instead of a round-trip per report
+    for start in range(0, len(missing_ids), _FETCH_BATCH_SIZE):
+        batch = missing_ids[start:start + _FETCH_BATCH_SIZE]
+        cursor = reports_collection.find(
+                {'id': {'$in': batch}}, projection={'_id': 0}, batch_size=len(batch))
+        fetched = {report['id']: report async for report in cursor}
+        _cache_reports(fetched)
+        reports.update(fetched)
+
+    return {i: reports[i] for i in scout_report_ids if i in reports}
+
+
 @flog
 @logger.catch(reraise=True)
 def store_scout_report(scout_report: dict) -> str:
-    """Stores the knowledge graph in the Google Cloud Storage bucket."""
+    """Stores the scout report in the reports collection and returns its new ID."""
+    scout_report_id, document = _new_report_document(scout_report)
+    _reports_collection().insert_one(document)
+
+    return scout_report_id
+
+
+@logger.catch(reraise=True)
+async def store_scout_report_async(scout_report: dict) -> str:
+    """Async variant of store_scout_report, for callers running on the event loop."""
+    scout_report_id, document = _new_report_document(scout_report)
+    reports_collection = await _async_reports_collection()
+    await reports_collection.insert_one(document)
+
+    return scout_report_id
+
+
+@logger.catch(reraise=True)
+async def store_scout_reports_async(scout_reports: list[dict]) -> list[str]:
+    """Stores the scout reports in the reports collection and returns their new IDs, in input order."""
+    if not scout_reports:
+        return []
+
+    scout_report_ids = []
+    operations = []
+    for scout_report in scout_reports:
+        scout_report_id, document = _new_report_document(scout_report)
+        scout_report_ids.append(scout_report_id)
+        operations.append(InsertOne(document))
+
+    # NOTE: one unordered bulk write instead of a round-trip per report, pymongo splits it to the server's limits
+    reports_collection = await _async_reports_collection()
+    await reports_collection.bulk_write(operations, ordered=False)
+
+    return scout_report_ids
+
+
+def _new_report_document(scout_report: dict) -> tuple[str, dict]:
+    """Assigns a new ID to the scout report and returns it with the document to insert."""
     scout_report_id = generate_random_string()
     scout_report.update({'id': scout_report_id})
 
-    reports_collection.replace_one(
-            {'id': scout_report_id}, scout_report, upsert=True)
+    # NOTE: the write encodes the report anyway, only pay for an extra encode when its markdown could be that large
+    # (a utf-8 character is at most 4 bytes)
+    text_length = sum(len(item.get('content') or '') for item in scout_report.get('analysis') or [])
+    if text_length * 4 > _LARGE_REPORT_BYTES:
+        report_size = len(bson.encode(scout_report))
+        if report_size > _LARGE_REPORT_BYTES:
+            logger.warning('storing an unusually large scout report', **_log_fields(
+                scout_report_id=scout_report_id, size_bytes=report_size))
+
+    # NOTE: the id is freshly generated, so a plain insert is enough (no upsert lookup),
+    # keyed on _id too; a shallow copy keeps insert_one from adding _id to the caller's dict
+    return scout_report_id, {'_id': scout_report_id, **scout_report}
 
-    return scout_report_id
@@ -1,10 +1,28 @@
-import json
-import requests
+import aiohttp
+import asyncio
+import orjson
+import os
 import re
-from ddgs import DDGS
+import statistics
+from cachetools import TTLCache
+from collections import deque
+from utils.http_session import get_session
 from utils.logger import logger
 
-def _search_hudl_api(player_name: str) -> list:
+_API_TIMEOUT = aiohttp.ClientTimeout(total=10)
+_PROFILE_RE = re.compile(r'/profile/(\d+)')
+# NOTE: a speculative web search runs to completion in its thread even when the api wins, spending ddg quota,
+# so only hedge api calls slower than ~19 in 20 recent ones (the configured delay until enough are measured)
+_WEB_SEARCH_HEDGE_DELAY = float(os.environ.get('HUDL_WEB_SEARCH_HEDGE_DELAY_SECONDS', 2.0))
+_MIN_LATENCY_SAMPLES = 20
+_api_latencies: deque[float] = deque(maxlen=100)
+# NOTE: hudl profiles rarely change, so repeat searches for a player are served from memory for an hour;
+# misses only for a few minutes, so a newly created profile is found soon after
+_search_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_not_found_cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+
+
+async def _search_hudl_api(player_name: str) -> list:
     api_url = 'https://www.hudl.com/api/v3/community-search/feed-users/search'
     payload = {
         'count': 20,
@@ -12,10 +30,13 @@ def _search_hudl_api(player_name: str) -> list:
         'skip': 0
     }
     
-    response = requests.post(api_url, json=payload, timeout=10)
-    response.raise_for_status()
+    # NOTE: shares the pooled hudl.com session with the profile scraper instead of blocking the event loop
+    session = await get_session()
+    async with session.post(api_url, json=payload, timeout=_API_TIMEOUT) as response:
+        response.raise_for_status()
+        content = await response.read()
     
-    data = response.json()
+    data = orjson.loads(content)
     results = data.get('results', [])
     
     hudl_urls = []
@@ -32,13 +53,13 @@ def _search_hudl_api(player_name: str) -> list:
             name_slug = result_name.replace(' ', '-')
             full_url = f"https://www.hudl.com/profile/{profile_id}/{name_slug}"
             hudl_urls.append(full_url)
-            
-            base_url = f"https://www.hudl.com/profile/{profile_id}"
-            hudl_urls.append(base_url)
     
     return hudl_urls
 
 def _search_hudl_web(player_name: str) -> list:
+    # NOTE: ddgs is only needed when the hudl api fails, import it on demand to keep startup light
+    from ddgs import DDGS
+
     search_query = f'site:hudl.com/profile {player_name}'
     
     hudl_urls = []
@@ -56,7 +77,7 @@ def _search_hudl_web(player_name: str) -> list:
                 
                 clean_url = url.split('?')[0].split('#')[0]
                 
-                profile_match = re.search(r'/profile/(\d+)', clean_url)
+                profile_match = _PROFILE_RE.search(clean_url)
                 if profile_match:
                     profile_id = profile_match.group(1)
                     
@@ -64,48 +85,92 @@ def _search_hudl_web(player_name: str) -> list:
                         seen_profile_ids.add(profile_id)
                         hudl_urls.append(clean_url)
                         
-                        base_url = f"https://www.hudl.com/profile/{profile_id}"
-                        if base_url != clean_url:
-                            hudl_urls.append(base_url)
-                        
                         if len(seen_profile_ids) >= 10:
                             break
     
     return hudl_urls
 
-def search_hudl_player(player_name: str) -> str:
+def _web_search_hedge_delay() -> float:
+    if len(_api_latencies) < _MIN_LATENCY_SAMPLES:
+        return _WEB_SEARCH_HEDGE_DELAY
+    return statistics.quantiles(_api_latencies, n=20)[-1]
+
+
+def _start_web_search(player_name: str) -> asyncio.Task:
+    # NOTE: ddgs is sync only, keep it off the event loop
+    return asyncio.create_task(asyncio.to_thread(_search_hudl_web, player_name))
+
+
+async def search_hudl_player(player_name: str) -> str:
+    cache_key = player_name.strip().lower()
+    result_json = _search_cache.get(cache_key) or _not_found_cache.get(cache_key)
+    if result_json is not None:
+        return result_json
+
+    result = await _search_hudl_player(player_name)
+    result_json = orjson.dumps(result).decode()
+    # NOTE: errors are not cached, the next call should retry the search
+    if result["status"] == "success":
+        _search_cache[cache_key] = result_json
+    elif result["status"] == "not_found":
+        _not_found_cache[cache_key] = result_json
+
+    return result_json
+
+
+async def _search_hudl_player(player_name: str) -> dict:
+    api_task = web_task = None
     try:
-        # Try Hudl API first
+        # Try Hudl API first, hedging a slow call with a speculative web search
+        started_at = asyncio.get_running_loop().time()
+        api_task = asyncio.create_task(_search_hudl_api(player_name))
+        done, _ = await asyncio.wait([api_task], timeout=_web_search_hedge_delay())
+        if not done:
+            web_task = _start_web_search(player_name)
+
         try:
-            hudl_urls = _search_hudl_api(player_name)
+            hudl_urls = await api_task
+            _api_latencies.append(asyncio.get_running_loop().time() - started_at)
             if hudl_urls:
-                return json.dumps({
+                return {
                     "status": "success",
-                    "message": f"Found {len(hudl_urls) // 2} Hudl profile(s) for {player_name}",
+                    "message": f"Found {len(hudl_urls)} Hudl profile(s) for {player_name}",
                     "urls": hudl_urls
-                })
+                }
         except Exception as api_error:
             logger.warning(f"Hudl API search failed for {player_name}: {api_error}. Falling back to web search.")
             
             # Fallback to web search
-            hudl_urls = _search_hudl_web(player_name)
+            if web_task is None:
+                web_task = _start_web_search(player_name)
+            hudl_urls = await web_task
             if hudl_urls:
-                return json.dumps({
+                return {
                     "status": "success",
-                    "message": f"Found {len(hudl_urls) // 2} Hudl profile(s) for {player_name} (via web search)",
+                    "message": f"Found {len(hudl_urls)} Hudl profile(s) for {player_name} (via web search)",
                     "urls": hudl_urls
-                })
+                }
         
-        return json.dumps({
+        return {
             "status": "not_found",
             "message": f"No Hudl profiles found for {player_name}",
             "urls": []
-        })
+        }
 
     except Exception as e:
         logger.exception(f"Error searching Hudl for player: {player_name}")
-        return json.dumps({
+        return {
             "status": "error",
             "message": f"Error searching Hudl: {str(e)}",
             "urls": []
-        })
\ No newline at end of file
+        }
+
+    finally:
+        # NOTE: the caller may have been cancelled while waiting, do not leave the api call running
+        if api_task is not None:
+            api_task.cancel()
+        if web_task is not None:
+            # NOTE: the api answered, drop the speculative web search along with any error it raised
+            web_task.cancel()
+            if web_task.done() and not web_task.cancelled():
+                web_task.exception()
\ No newline at end of file
@@ -1,6 +1,14 @@
 import string
 import secrets
 
+import orjson
+
+_CHARACTERS = string.ascii_lowercase + string.digits
+# NOTE: 252 is the largest multiple of 36 below 256, dropping the bytes above it keeps every character equally likely
+_BYTE_LIMIT = 256 - 256 % len(_CHARACTERS)
+_BYTE_TO_CHARACTER = bytes(ord(_CHARACTERS[b % len(_CHARACTERS)]) for b in range(256))
+_REJECTED_BYTES = bytes(range(_BYTE_LIMIT, 256))
+
 
 def generate_random_string(length=10):
     """
@@ -17,10 +25,26 @@ def generate_random_string(length=10):
     if not isinstance(length, int) or length <= 0:
         raise ValueError("Length must be a positive integer")
 
-    # Define the character set to choose from
-    characters = string.ascii_lowercase + string.digits
+    # Map one buffer of secure random bytes onto the character set in C, instead of a secrets.choice() per character
+    random_string = b''
+    while len(random_string) < length:
+        random_string += secrets.token_bytes(length + 8).translate(_BYTE_TO_CHARACTER, _REJECTED_BYTES)
+
+    return random_string[:length].decode()
 
-    # Use secrets.choice() for cryptographic security
-    random_string = ''.join(secrets.choice(characters) for _ in range(length))
 
-    return random_string
+def dumps(obj, indent: bool = False) -> str:
+    """
+    Serializes an object (e.g. a scout report dict) to a JSON string using orjson.
+
+    Args:
+        obj: The object to serialize.
+        indent (bool): Whether to pretty-print with a 2-space indent.
+
+    Returns:
+        str: The JSON string.
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, option=option).decode()
@@ -1,8 +1,7 @@
 import asyncio
-import json
 import os
-import requests
 import atexit
+import orjson
 from dotenv import load_dotenv
 from typing import Annotated
 
@@ -24,8 +23,9 @@ from opentelemetry.sdk.trace import TracerProvider
 
 from knowledge_curation_tool import main as _curate_knowledge
 from scout_report_agent.main import main as _fetch_scout_report
-from scout_report_agent.scout_report_service import fetch_scout_report
-from sources.hudl.scrape_hudl_profile_data import close_session
+from scout_report_agent.scout_report_service import fetch_scout_report_async
+from scout_report_agent.utils import dumps
+from utils.http_session import close_session, get_session
 from utils.logger import logger, _log_fields, _safe_serialize
 from utils.logs_with_request_context import log_with_request_context
 
@@ -51,7 +51,7 @@ async def curate_knowledge(
     graph_id = headers['x-graph-id']
     user_id = headers.get('x-author-id', 'anonymous')
 
-    return _curate_knowledge(graph_id=graph_id, user_id=user_id, query=query)
+    return await _curate_knowledge(graph_id=graph_id, user_id=user_id, query=query)
 
 @mcp.tool(
         name='generate_scout_report',
@@ -83,9 +83,9 @@ async def generate_scout_report(
     if result and ('player' in result):
         message = f"""{result['player']} has property "Scout Report ID" with value "{result['id']}"."""
         logger.info('player found in generate scout report result, proceeding to curate knowledge')
-        _curate_knowledge(graph_id=graph_id, user_id=user_id, query=message)
+        await _curate_knowledge(graph_id=graph_id, user_id=user_id, query=message)
 
-    return json.dumps(result)
+    return dumps(result)
 
 
 @mcp.tool(
@@ -103,7 +103,7 @@ async def fetch_scout_report_by_id(
         scout_report_id=scout_report_id
     ))
 
-    result = fetch_scout_report(scout_report_id)
+    result = await fetch_scout_report_async(scout_report_id)
 
     logger.info("fetch_scout_report_by_id completed", *_log_fields(
         result=result
@@ -126,11 +126,13 @@ async def search_knowledge_graph(
     logger.info("search_knowledge_graph called", query=query)
 
     url = os.environ['KG_URL'] + '/search'
-    r = requests.get(url, params={'query': query, 'graph_id': graph_id})
-    result = r.json()
+    # NOTE: awaited on the shared aiohttp session so the search does not block other tool calls
+    session = await get_session()
+    async with session.get(url, params={'query': query, 'graph_id': graph_id}) as r:
+        result = orjson.loads(await r.read())
 
     logger.info("search_knowledge_graph completed", **_log_fields(
-        status_code=r.status_code, result=result
+        status_code=r.status, result=result
     ))
 
     return result
@@ -1,7 +1,9 @@
 from typing import Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class AthleticismStats(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     forty_yard_dash: Optional[float] = None
     forty_verified: Optional[bool] = None
     vertical: Optional[int] = None
@@ -34,6 +36,8 @@ class AthleticismStats(BaseModel):
 
 
 class HudlVideoSource(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     url: str
     title: str
     date: int  # unix epoch timestamp
@@ -42,6 +46,8 @@ class HudlVideoSource(BaseModel):
 
 
 class HudlPlayerData(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     name: str
     positions: str
     school: str
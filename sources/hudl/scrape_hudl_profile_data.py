@@ -1,26 +1,68 @@
-import aiohttp
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import json
 import re
+from types import MappingProxyType
+from utils.http_session import get_session
 from utils.logger import logger
 from .hudl_types import HudlPlayerData, HudlVideoSource, AthleticismStats
 
-# Module-level session for reuse across requests
-_session: aiohttp.ClientSession | None = None
 
-
-async def get_session() -> aiohttp.ClientSession:
-    global _session
-    if _session is None or _session.closed:
-        _session = aiohttp.ClientSession()
-    return _session
-
-
-async def close_session():
-    global _session
-    if _session is not None and not _session.closed:
-        await _session.close()
-        _session = None
+def _safe_str(value, default=""):
+    if value is None:
+        return default
+    return str(value).strip() if str(value).strip() else default
+
+
+def _safe_float(value):
+    try:
+        return float(value) if value is not None else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _safe_int(value):
+    try:
+        return int(value) if value is not None else None
+    except (ValueError, TypeError):
+        return None
+
+
+_SCRIPT_TAGS = SoupStrainer("script")
+_HUDL_EMBED_RE = re.compile(r"window\.__hudlEmbed")
+_HUDL_EMBED_JSON_RE = re.compile(r"window\.__hudlEmbed\s*=\s*({.*?});", re.DOTALL)
+_HUDL_EMBED_JSON_FALLBACK_RE = re.compile(r"window\.__hudlEmbed\s*=\s*({.*});</script>", re.DOTALL)
+
+# NOTE: AthleticismStats field -> (hudl strengthAndSpeed key, converter), read-only and shared across calls
+_ATHLETICISM_FIELDS = MappingProxyType({
+    "forty_yard_dash": ("forty", _safe_float),
+    "forty_verified": ("fortyVerified", None),
+    "vertical": ("vertical", _safe_int),
+    "vertical_verified": ("verticalVerified", None),
+    "bench": ("bench", _safe_int),
+    "bench_verified": ("benchVerified", None),
+    "bench_185_reps": ("benchPressReps", _safe_int),
+    "bench_185_reps_verified": ("benchPressRepsVerified", None),
+    "squat": ("squat", _safe_int),
+    "deadlift": ("deadLift", _safe_int),
+    "clean": ("clean", _safe_int),
+    "pro_agility": ("proAgility", _safe_float),
+    "shuttle": ("shuttle", _safe_float),
+    "shuttle_verified": ("shuttleVerified", None),
+    "powerball": ("powerball", _safe_int),
+    "powerball_verified": ("powerballVerified", None),
+    "nike_football_rating": ("nikeFootballRating", _safe_int),
+    "nike_football_rating_verified": ("nikeFootballRatingVerified", None),
+    "meter_100": ("meter100", _safe_float),
+    "meter_400": ("meter400", _safe_float),
+    "meter_1600": ("meter1600", _safe_float),
+    "meter_3200": ("meter3200", _safe_float),
+    "approach_jump_touch_one_arm": ("approachJumpTouchOneArm", _safe_int),
+    "vertical_jump_one_arm": ("verticalJumpOneArm", _safe_int),
+    "vertical_jumping_block_two_arms": ("verticalJumpingBlockTwoArms", _safe_int),
+    "six_touches_sideline_to_sideline": ("sixTouchesSidelineToSideline", _safe_float),
+    "standing_reach": ("standingReach", _safe_int),
+    "standing_blocking_reach": ("standingBlockingReach", _safe_int),
+})
 
 
 @logger.catch(reraise=True)
@@ -29,21 +71,18 @@ async def scrape_hudl_profile_data(url: str) -> HudlPlayerData:
     async with session.get(url) as response:
         html_content = await response.text()
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    # NOTE: the player data lives in an inline script, only build the tree for <script> tags
+    soup = BeautifulSoup(html_content, "html.parser", parse_only=_SCRIPT_TAGS)
 
-    script_tag = soup.find("script", string=re.compile(r"window\.__hudlEmbed"))
+    script_tag = soup.find("script", string=_HUDL_EMBED_RE)
     if not script_tag:
         raise Exception("Could not find player data in page")
 
     script_content = script_tag.string
 
-    json_match = re.search(
-        r"window\.__hudlEmbed\s*=\s*({.*?});", script_content, re.DOTALL
-    )
+    json_match = _HUDL_EMBED_JSON_RE.search(script_content)
     if not json_match:
-        json_match = re.search(
-            r"window\.__hudlEmbed\s*=\s*({.*});</script>", script_content, re.DOTALL
-        )
+        json_match = _HUDL_EMBED_JSON_FALLBACK_RE.search(script_content)
 
     if not json_match:
         raise Exception("Could not extract JSON data from script")
@@ -60,22 +99,16 @@ async def scrape_hudl_profile_data(url: str) -> HudlPlayerData:
     overview = about_data.get("overview", {})
     strength_speed = about_data.get("strengthAndSpeed", {})
 
-
-    def safe_str(value, default=""):
-        if value is None:
-            return default
-        return str(value).strip() if str(value).strip() else default
-
-    name = safe_str(user_data.get("primaryName"))
-    positions = safe_str(user_data.get("positions"))
-    school = safe_str(overview.get("organization"))
-    height = safe_str(overview.get("height"))
-    weight = safe_str(overview.get("weight"))
-    location = safe_str(overview.get("location"))
+    name = _safe_str(user_data.get("primaryName"))
+    positions = _safe_str(user_data.get("positions"))
+    school = _safe_str(overview.get("organization"))
+    height = _safe_str(overview.get("height"))
+    weight = _safe_str(overview.get("weight"))
+    location = _safe_str(overview.get("location"))
     avatar_url = user_data.get("profileLogoUri")
     
     if avatar_url is None:
-        avatar_url = safe_str(user_data.get("mobileProfileLogoUri"))
+        avatar_url = _safe_str(user_data.get("mobileProfileLogoUri"))
 
     graduation_year = overview.get("graduationYear")
     class_year = str(graduation_year) if graduation_year is not None else None
@@ -86,75 +119,9 @@ async def scrape_hudl_profile_data(url: str) -> HudlPlayerData:
     athleticism_stats = None
     if strength_speed:
         athleticism_data = {}
-
-        def safe_float(value):
-            try:
-                return float(value) if value is not None else None
-            except (ValueError, TypeError):
-                return None
-
-        def safe_int(value):
-            try:
-                return int(value) if value is not None else None
-            except (ValueError, TypeError):
-                return None
-
-        athleticism_data["forty_yard_dash"] = safe_float(
-            strength_speed.get("forty")
-        )
-        athleticism_data["forty_verified"] = strength_speed.get("fortyVerified")
-        athleticism_data["vertical"] = safe_int(strength_speed.get("vertical"))
-        athleticism_data["vertical_verified"] = strength_speed.get(
-            "verticalVerified"
-        )
-        athleticism_data["bench"] = safe_int(strength_speed.get("bench"))
-        athleticism_data["bench_verified"] = strength_speed.get("benchVerified")
-        athleticism_data["bench_185_reps"] = safe_int(
-            strength_speed.get("benchPressReps")
-        )
-        athleticism_data["bench_185_reps_verified"] = strength_speed.get(
-            "benchPressRepsVerified"
-        )
-        athleticism_data["squat"] = safe_int(strength_speed.get("squat"))
-        athleticism_data["deadlift"] = safe_int(strength_speed.get("deadLift"))
-        athleticism_data["clean"] = safe_int(strength_speed.get("clean"))
-        athleticism_data["pro_agility"] = safe_float(
-            strength_speed.get("proAgility")
-        )
-        athleticism_data["shuttle"] = safe_float(strength_speed.get("shuttle"))
-        athleticism_data["shuttle_verified"] = strength_speed.get("shuttleVerified")
-        athleticism_data["powerball"] = safe_int(strength_speed.get("powerball"))
-        athleticism_data["powerball_verified"] = strength_speed.get(
-            "powerballVerified"
-        )
-        athleticism_data["nike_football_rating"] = safe_int(
-            strength_speed.get("nikeFootballRating")
-        )
-        athleticism_data["nike_football_rating_verified"] = strength_speed.get(
-            "nikeFootballRatingVerified"
-        )
-        athleticism_data["meter_100"] = safe_float(strength_speed.get("meter100"))
-        athleticism_data["meter_400"] = safe_float(strength_speed.get("meter400"))
-        athleticism_data["meter_1600"] = safe_float(strength_speed.get("meter1600"))
-        athleticism_data["meter_3200"] = safe_float(strength_speed.get("meter3200"))
-        athleticism_data["approach_jump_touch_one_arm"] = safe_int(
-            strength_speed.get("approachJumpTouchOneArm")
-        )
-        athleticism_data["vertical_jump_one_arm"] = safe_int(
-            strength_speed.get("verticalJumpOneArm")
-        )
-        athleticism_data["vertical_jumping_block_two_arms"] = safe_int(
-            strength_speed.get("verticalJumpingBlockTwoArms")
-        )
-        athleticism_data["six_touches_sideline_to_sideline"] = safe_float(
-            strength_speed.get("sixTouchesSidelineToSideline")
-        )
-        athleticism_data["standing_reach"] = safe_int(
-            strength_speed.get("standingReach")
-        )
-        athleticism_data["standing_blocking_reach"] = safe_int(
-            strength_speed.get("standingBlockingReach")
-        )
+        for field, (key, convert) in _ATHLETICISM_FIELDS.items():
+            value = strength_speed.get(key)
+            athleticism_data[field] = convert(value) if convert else value
 
         achievements = strength_speed.get("achievements")
         if isinstance(achievements, list):
@@ -202,7 +169,7 @@ async def scrape_hudl_profile_data(url: str) -> HudlPlayerData:
         class_year=class_year,
         jersey_number=jersey_number,
         athleticism=athleticism_stats,
-        source_identifier=safe_str(user_data.get("userId")),
+        source_identifier=_safe_str(user_data.get("userId")),
         hudl_video_sources=hudl_video_sources,
         avatar_url=avatar_url
     )
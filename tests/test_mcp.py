@@ -1,4 +1,3 @@
-import json
 import re
 from unittest.mock import patch
 
@@ -8,7 +7,7 @@ from fastmcp.client.transports import FastMCPTransport
 from pydantic import ValidationError
 from utils.logger import logger, _log_fields
 
-from scout_report_agent.scout_report_schema import ScoutReport
+from scout_report_agent.scout_report_schema import SCOUT_REPORT_ADAPTER
 from server import mcp
 
 @pytest.fixture
@@ -45,11 +44,9 @@ async def test_generate_scout_report(main_mcp_client: Client[FastMCPTransport]):
         assert call_result is not None
         
         result_text = call_result.content[0].text
-        result = json.loads(result_text)
 
-        
         try:
-            scout_report = ScoutReport(**result)
+            scout_report = SCOUT_REPORT_ADAPTER.validate_json(result_text)
             assert 'Ryder' in scout_report.player.name and 'Lyons' in scout_report.player.name
             if scout_report.player.hudl_profile is not None:
                 assert re.match(r'https://www\.hudl\.com/profile/\d+(?:/[\w-]+)?$', scout_report.player.hudl_profile)
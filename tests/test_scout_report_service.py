@@ -0,0 +1,194 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from scout_report_agent import scout_report_service
+from scout_report_agent.scout_report_service import fetch_scout_reports_async, store_scout_reports_async
+
+
+class _AsyncCursor:
+    """Stands in for pymongo's async cursor over a fixed list of documents."""
+
+    def __init__(self, documents):
+        self._documents = iter(documents)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._documents)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+@pytest.fixture(autouse=True)
+def empty_report_cache():
+    scout_report_service._report_cache.clear()
+    yield
+    scout_report_service._report_cache.clear()
+
+
+@pytest.fixture
+def reports_collection():
+    collection = MagicMock()
+    with patch.object(scout_report_service, '_async_reports_collection', AsyncMock(return_value=collection)):
+        yield collection
+
+
+def test_reports_collection_closes_the_client_of_a_previous_event_loop(monkeypatch):
+    monkeypatch.setenv('MONGO_URI', 'mongodb://localhost')
+    monkeypatch.setattr(scout_report_service, '_mongo_client', None)
+    monkeypatch.setattr(scout_report_service, '_mongo_client_loop', None)
+    monkeypatch.setattr(scout_report_service, '_async_reports', None)
+    monkeypatch.setattr(scout_report_service, '_indexes_ensured', False)
+    clients = [MagicMock(close=AsyncMock()), MagicMock(close=AsyncMock())]
+    for client in clients:
+        client.get_database.return_value.get_collection.return_value.create_index = AsyncMock()
+
+    with patch.object(scout_report_service, 'AsyncMongoClient', side_effect=clients):
+        asyncio.run(scout_report_service._async_reports_collection())
+        asyncio.run(scout_report_service._async_reports_collection())
+
+    clients[0].close.assert_awaited_once()
+    clients[1].close.assert_not_called()
+
+
+def test_reports_collection_ensures_the_id_index_once_per_process(monkeypatch):
+    monkeypatch.setenv('MONGO_URI', 'mongodb://localhost')
+    monkeypatch.setattr(scout_report_service, '_mongo_client', None)
+    monkeypatch.setattr(scout_report_service, '_mongo_client_loop', None)
+    monkeypatch.setattr(scout_report_service, '_async_reports', None)
+    monkeypatch.setattr(scout_report_service, '_indexes_ensured', False)
+    clients = [MagicMock(close=AsyncMock()), MagicMock(close=AsyncMock())]
+    collections = [client.get_database.return_value.get_collection.return_value for client in clients]
+    collections[0].create_index = AsyncMock(side_effect=RuntimeError('not authorized'))
+    collections[1].create_index = AsyncMock()
+
+    with patch.object(scout_report_service, 'AsyncMongoClient', side_effect=clients):
+        assert asyncio.run(scout_report_service._async_reports_collection()) is collections[0]
+        asyncio.run(scout_report_service._async_reports_collection())
+
+    collections[0].create_index.assert_awaited_once_with('id', unique=True)
+    collections[1].create_index.assert_not_called()
+
+
+class TestSyncScoutReports:
+    """Test cases for the sync fetch_scout_report and store_scout_report functions."""
+
+    @pytest.fixture
+    def sync_reports_collection(self):
+        collection = MagicMock()
+        with patch.object(scout_report_service, '_reports_collection', return_value=collection):
+            yield collection
+
+    def test_fetch_shares_the_report_cache(self, sync_reports_collection):
+        scout_report_service._cache_reports({'a': {'id': 'a'}})
+
+        assert scout_report_service.fetch_scout_report('a') == {'id': 'a'}
+        sync_reports_collection.find_one.assert_not_called()
+
+    def test_store_inserts_a_new_report_document(self, sync_reports_collection):
+        scout_report = {'player': 'a'}
+
+        scout_report_id = scout_report_service.store_scout_report(scout_report)
+
+        sync_reports_collection.insert_one.assert_called_once_with(
+                {'_id': scout_report_id, 'id': scout_report_id, 'player': 'a'})
+        assert '_id' not in scout_report
+
+
+class TestFetchScoutReportsAsync:
+    """Test cases for the fetch_scout_reports_async function."""
+
+    async def test_returns_reports_in_request_order(self, reports_collection):
+        reports_collection.find.return_value = _AsyncCursor([{'id': 'b'}, {'id': 'a'}])
+
+        reports = await fetch_scout_reports_async(['a', 'missing', 'b'])
+
+        assert list(reports) == ['a', 'b']
+        assert reports['a'] == {'id': 'a'}
+
+    async def test_queries_duplicate_ids_once(self, reports_collection):
+        reports_collection.find.return_value = _AsyncCursor([{'id': 'a'}, {'id': 'b'}])
+
+        reports = await fetch_scout_reports_async(['a', 'b', 'a'])
+
+        assert list(reports) == ['a', 'b']
+        reports_collection.find.assert_called_once()
+        assert reports_collection.find.call_args.args[0] == {'id': {'$in': ['a', 'b']}}
+
+    async def test_only_queries_cache_misses(self, reports_collection):
+        scout_report_service._cache_reports({'a': {'id': 'a'}})
+        reports_collection.find.return_value = _AsyncCursor([{'id': 'b'}])
+
+        reports = await fetch_scout_reports_async(['a', 'b'])
+
+        assert list(reports) == ['a', 'b']
+        assert reports_collection.find.call_args.args[0] == {'id': {'$in': ['b']}}
+
+        reports_collection.find.reset_mock()
+        reports = await fetch_scout_reports_async(['b', 'a'])
+
+        assert list(reports) == ['b', 'a']
+        reports_collection.find.assert_not_called()
+
+    async def test_cached_reports_are_not_shared_with_callers(self, reports_collection):
+        reports_collection.find.return_value = _AsyncCursor([{'id': 'a', 'tags': ['QB']}])
+
+        reports = await fetch_scout_reports_async(['a'])
+        reports['a']['tags'].append('mutated')
+
+        cached = await fetch_scout_reports_async(['a'])
+        assert cached['a'] == {'id': 'a', 'tags': ['QB']}
+
+
+class TestStoreScoutReportsAsync:
+    """Test cases for the store_scout_reports_async function."""
+
+    async def test_returns_ids_in_input_order(self, reports_collection):
+        reports_collection.bulk_write = AsyncMock()
+        scout_reports = [{'player': 'a'}, {'player': 'b'}, {'player': 'c'}]
+
+        scout_report_ids = await store_scout_reports_async(scout_reports)
+
+        operations = reports_collection.bulk_write.call_args.args[0]
+        assert [operation._doc['_id'] for operation in operations] == scout_report_ids
+        assert [operation._doc['player'] for operation in operations] == ['a', 'b', 'c']
+        assert len(set(scout_report_ids)) == 3
+        assert reports_collection.bulk_write.call_args.kwargs == {'ordered': False}
+
+    async def test_does_not_add_mongo_ids_to_the_callers_reports(self, reports_collection):
+        reports_collection.bulk_write = AsyncMock()
+        scout_reports = [{'player': 'a'}, {'player': 'b'}]
+
+        scout_report_ids = await store_scout_reports_async(scout_reports)
+
+        assert all('_id' not in scout_report for scout_report in scout_reports)
+        assert [scout_report['id'] for scout_report in scout_reports] == scout_report_ids
+
+    async def test_skips_the_write_when_there_is_nothing_to_store(self, reports_collection):
+        reports_collection.bulk_write = AsyncMock()
+
+        assert await store_scout_reports_async([]) == []
+        reports_collection.bulk_write.assert_not_called()
+
+
+class TestNewReportDocument:
+    """Test cases for the _new_report_document function."""
+
+    def test_does_not_encode_reports_with_little_text(self):
+        with patch.object(scout_report_service.bson, 'encode') as encode:
+            scout_report_service._new_report_document({'analysis': [{'content': 'Quick release.'}]})
+
+        encode.assert_not_called()
+
+    def test_warns_about_reports_with_a_lot_of_text(self):
+        content = 'x' * (scout_report_service._LARGE_REPORT_BYTES + 1)
+
+        with patch.object(scout_report_service.logger, 'warning') as warning:
+            scout_report_id, _ = scout_report_service._new_report_document({'analysis': [{'content': content}]})
+
+        warning.assert_called_once()
+        assert warning.call_args.kwargs['scout_report_id'] == scout_report_id
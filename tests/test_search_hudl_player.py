@@ -1,6 +1,12 @@
+import asyncio
 import json
 import re
+import time
+from collections import deque
+
 import pytest
+from cachetools import TTLCache
+from scout_report_agent.tools import search_hudl_player as search_hudl_player_module
 from scout_report_agent.tools.search_hudl_player import search_hudl_player
 
 
@@ -14,8 +20,8 @@ class TestSearchHudlPlayer:
         ("Dillon Hartman", ["18596366"]),
         ("Scott Nardinel", ["19142423"]),  # Note: Nardinelli vs Nardinel
     ])
-    def test_search_hudl_player_finds_correct_profiles(self, player_name, expected_profile_ids):
-        result_json = search_hudl_player(player_name)
+    async def test_search_hudl_player_finds_correct_profiles(self, player_name, expected_profile_ids):
+        result_json = await search_hudl_player(player_name)
         result = json.loads(result_json)
 
         assert result["status"] == "success", f"Expected success status for {player_name}, got {result['status']}"
@@ -34,23 +40,23 @@ class TestSearchHudlPlayer:
             f"Found profile IDs: {found_profile_ids}"
         )
 
-    def test_search_hudl_player_returns_valid_json(self):
-        result = search_hudl_player("Alex Duckett")
+    async def test_search_hudl_player_returns_valid_json(self):
+        result = await search_hudl_player("Alex Duckett")
         parsed = json.loads(result)
         assert "status" in parsed
         assert "message" in parsed
         assert "urls" in parsed
         assert isinstance(parsed["urls"], list)
 
-    def test_search_hudl_player_nonexistent_player(self):
-        result_json = search_hudl_player("ZzzNonExistentPlayerXyz123")
+    async def test_search_hudl_player_nonexistent_player(self):
+        result_json = await search_hudl_player("ZzzNonExistentPlayerXyz123")
         result = json.loads(result_json)
 
         assert result["status"] in ["success", "not_found", "error"]
         assert isinstance(result["urls"], list)
 
-    def test_search_hudl_player_url_format(self):
-        result_json = search_hudl_player("Alex Duckett")
+    async def test_search_hudl_player_url_format(self):
+        result_json = await search_hudl_player("Alex Duckett")
         result = json.loads(result_json)
 
         if result["status"] == "success" and len(result["urls"]) > 0:
@@ -58,41 +64,152 @@ class TestSearchHudlPlayer:
                 assert url.startswith("https://www.hudl.com/profile/")
                 assert re.search(r'/profile/\d+', url)
 
-    @pytest.mark.parametrize("player_name,expected_urls", [
-        ("Alex Duckett", [
-            "https://www.hudl.com/profile/17709524/Alex-Duckett",
-            "https://www.hudl.com/profile/17709524"
-        ]),
-        ("Ryder Lyons", [
-            "https://www.hudl.com/profile/16389887/Ryder-Lyons",
-            "https://www.hudl.com/profile/16389887"
-        ]),
-        ("Bishop Merriweather", [
-            "https://www.hudl.com/profile/17709508/Bishop-Merriweather",
-            "https://www.hudl.com/profile/17709508"
-        ]),
-        ("Dillon Hartman", [
-            "https://www.hudl.com/profile/18596366/Dillon-Hartman",
-            "https://www.hudl.com/profile/18596366"
-        ]),
-        ("Scott Nardinelli", [
-            "https://www.hudl.com/profile/19142423/Scott-Nardinelli",
-            "https://www.hudl.com/profile/19142423"
-        ]),
+    @pytest.mark.parametrize("player_name,expected_url", [
+        ("Alex Duckett", "https://www.hudl.com/profile/17709524/Alex-Duckett"),
+        ("Ryder Lyons", "https://www.hudl.com/profile/16389887/Ryder-Lyons"),
+        ("Bishop Merriweather", "https://www.hudl.com/profile/17709508/Bishop-Merriweather"),
+        ("Dillon Hartman", "https://www.hudl.com/profile/18596366/Dillon-Hartman"),
+        ("Scott Nardinelli", "https://www.hudl.com/profile/19142423/Scott-Nardinelli"),
     ])
-    def test_search_hudl_player_exact_url_match(self, player_name, expected_urls):
-        result_json = search_hudl_player(player_name)
+    async def test_search_hudl_player_exact_url_match(self, player_name, expected_url):
+        result_json = await search_hudl_player(player_name)
         result = json.loads(result_json)
 
         assert result["status"] == "success", f"Expected success for {player_name}"
 
-        found_urls = set(result["urls"])
-        expected_urls_set = set(expected_urls)
-
-        profile_id = expected_urls[0].split("/profile/")[1].split("/")[0]
-        found_matching = any(profile_id in url for url in found_urls)
+        found_urls = result["urls"]
+        profile_id = expected_url.split("/profile/")[1].split("/")[0]
+        matching_urls = [url for url in found_urls if f"/profile/{profile_id}" in url]
 
-        assert found_matching, (
-            f"Expected to find profile ID {profile_id} in results for {player_name}. "
+        assert matching_urls == [expected_url], (
+            f"Expected exactly {expected_url} for profile ID {profile_id} in results for {player_name}. "
             f"Found URLs: {found_urls}"
         )
+
+    async def test_search_hudl_player_returns_each_profile_once(self):
+        result = json.loads(await search_hudl_player("Alex Duckett"))
+
+        profile_ids = [re.search(r'/profile/(\d+)', url).group(1) for url in result["urls"]]
+        assert len(profile_ids) == len(set(profile_ids)), (
+            f"Expected one URL per profile, found URLs: {result['urls']}"
+        )
+
+
+class TestSearchHudlPlayerHedging:
+    """Test cases for racing the Hudl API against the web search fallback, with both mocked."""
+
+    HEDGE_DELAY = 0.05
+
+    @pytest.fixture(autouse=True)
+    def isolated_search(self, monkeypatch):
+        monkeypatch.setattr(search_hudl_player_module, '_WEB_SEARCH_HEDGE_DELAY', self.HEDGE_DELAY)
+        monkeypatch.setattr(search_hudl_player_module, '_api_latencies', deque(maxlen=100))
+        search_hudl_player_module._search_cache.clear()
+        search_hudl_player_module._not_found_cache.clear()
+        yield
+        search_hudl_player_module._search_cache.clear()
+        search_hudl_player_module._not_found_cache.clear()
+
+    @pytest.fixture
+    def web_calls(self, monkeypatch):
+        web_calls = []
+
+        def search_hudl_web(player_name):
+            web_calls.append(player_name)
+            time.sleep(0.01)
+            return ["https://www.hudl.com/profile/2/Web-Result"]
+
+        monkeypatch.setattr(search_hudl_player_module, '_search_hudl_web', search_hudl_web)
+        return web_calls
+
+    def mock_api(self, monkeypatch, delay, error=None):
+        async def search_hudl_api(player_name):
+            await asyncio.sleep(delay)
+            if error:
+                raise error
+            return ["https://www.hudl.com/profile/1/Api-Result"]
+
+        monkeypatch.setattr(search_hudl_player_module, '_search_hudl_api', search_hudl_api)
+
+    async def test_fast_api_success_skips_the_web_search(self, monkeypatch, web_calls):
+        self.mock_api(monkeypatch, delay=0)
+
+        result = json.loads(await search_hudl_player("Alex Duckett"))
+
+        assert result["urls"] == ["https://www.hudl.com/profile/1/Api-Result"]
+        assert web_calls == []
+
+    async def test_slow_api_success_wins_over_the_speculative_web_search(self, monkeypatch, web_calls):
+        self.mock_api(monkeypatch, delay=self.HEDGE_DELAY * 4)
+
+        result = json.loads(await search_hudl_player("Alex Duckett"))
+
+        assert result["urls"] == ["https://www.hudl.com/profile/1/Api-Result"]
+        assert "via web search" not in result["message"]
+        assert web_calls == ["Alex Duckett"]
+
+    async def test_fast_api_failure_falls_back_to_the_web_search(self, monkeypatch, web_calls):
+        self.mock_api(monkeypatch, delay=0, error=RuntimeError("api down"))
+
+        result = json.loads(await search_hudl_player("Alex Duckett"))
+
+        assert result["urls"] == ["https://www.hudl.com/profile/2/Web-Result"]
+        assert "via web search" in result["message"]
+        assert web_calls == ["Alex Duckett"]
+
+    async def test_slow_api_failure_reuses_the_speculative_web_search(self, monkeypatch, web_calls):
+        self.mock_api(monkeypatch, delay=self.HEDGE_DELAY * 4, error=RuntimeError("api down"))
+
+        result = json.loads(await search_hudl_player("Alex Duckett"))
+
+        assert result["urls"] == ["https://www.hudl.com/profile/2/Web-Result"]
+        assert "via web search" in result["message"]
+        assert web_calls == ["Alex Duckett"]
+
+    async def test_cancelling_the_search_cancels_the_api_call(self, monkeypatch, web_calls):
+        api_cancelled = asyncio.Event()
+
+        async def search_hudl_api(player_name):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                api_cancelled.set()
+                raise
+
+        monkeypatch.setattr(search_hudl_player_module, '_WEB_SEARCH_HEDGE_DELAY', 10)
+        monkeypatch.setattr(search_hudl_player_module, '_search_hudl_api', search_hudl_api)
+
+        search = asyncio.create_task(search_hudl_player("Alex Duckett"))
+        await asyncio.sleep(self.HEDGE_DELAY)
+        search.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await search
+        await asyncio.wait_for(api_cancelled.wait(), timeout=1)
+
+    async def test_hedge_delay_follows_measured_api_latency(self, monkeypatch, web_calls):
+        monkeypatch.setattr(search_hudl_player_module, '_api_latencies', deque([0.1] * 19 + [0.3], maxlen=100))
+
+        assert search_hudl_player_module._web_search_hedge_delay() == pytest.approx(0.29)
+
+    async def test_not_found_result_is_searched_again_after_a_short_ttl(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr(search_hudl_player_module, '_not_found_cache', TTLCache(
+                maxsize=1024, ttl=search_hudl_player_module._not_found_cache.ttl, timer=lambda: now[0]))
+        api_calls = []
+
+        async def search_hudl_api(player_name):
+            api_calls.append(player_name)
+            return []
+
+        monkeypatch.setattr(search_hudl_player_module, '_search_hudl_api', search_hudl_api)
+
+        assert json.loads(await search_hudl_player("Alex Duckett"))["status"] == "not_found"
+        assert json.loads(await search_hudl_player("Alex Duckett"))["status"] == "not_found"
+        assert len(api_calls) == 1
+        assert "alex duckett" not in search_hudl_player_module._search_cache
+
+        now[0] += search_hudl_player_module._not_found_cache.ttl + 1
+        await search_hudl_player("Alex Duckett")
+
+        assert len(api_calls) == 2
@@ -0,0 +1,35 @@
+import aiohttp
+import asyncio
+from utils.logger import logger
+
+# Module-level session for reuse across requests
+_session: aiohttp.ClientSession | None = None
+# NOTE: a session is bound to the event loop it was created on, so keep one per loop
+_session_loop: asyncio.AbstractEventLoop | None = None
+# NOTE: caps in-flight requests across every caller of the shared session, the rest wait for a free connection
+_MAX_CONNECTIONS = 32
+
+
+async def get_session() -> aiohttp.ClientSession:
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        stale_session = _session
+        _session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=_MAX_CONNECTIONS))
+        _session_loop = loop
+
+        # NOTE: close the session left on the previous loop, or its connector and sockets leak
+        if stale_session is not None and not stale_session.closed:
+            try:
+                await stale_session.close()
+            except Exception:
+                logger.warning('failed to close the http session of a previous event loop')
+    return _session
+
+
+async def close_session():
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+        _session = None
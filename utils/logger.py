@@ -1,7 +1,7 @@
 from loguru import logger
 import sys
 import os
-import json
+import orjson
 
 logger.remove(0)
 
@@ -17,7 +17,8 @@ logger.add(
 
 def _safe_serialize(obj):
     try:
-        json.dumps(obj)
+        # NOTE: only probing that the value is JSON serializable, orjson does that far cheaper than json
+        orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
         return obj
     except (TypeError, ValueError):
         return str(obj)[:10000]  # Truncate long strings